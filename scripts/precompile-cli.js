@@ -13,26 +13,24 @@ async function precompileBinaries() {
   console.log("🔨 Pre-compiling CLI binaries to avoid test lock contention...");
 
   const binaries = ["cnp-unified", "cnp-optimized"];
-
-  for (const binary of binaries) {
-    try {
-      console.log(`   Compiling ${binary}...`);
-      const { stdout, stderr } = await execAsync(
-        `cd src-tauri && cargo build --bin ${binary}`,
-        { timeout: 300000 } // 5 minutes timeout
-      );
-
-      if (stderr && !stderr.includes("Finished")) {
-        console.log(
-          `   ⚠️  ${binary} warnings: ${stderr.substring(0, 200)}...`
-        );
-      }
-
-      console.log(`   ✅ ${binary} compiled successfully`);
-    } catch (error) {
-      console.error(`   ❌ Failed to compile ${binary}:`, error.message);
-      throw error;
+  // 單次 cargo 調用同時建置所有二進制，共用依賴解析並讓 cargo 平行編譯
+  const binArgs = binaries.map((binary) => `--bin ${binary}`).join(" ");
+
+  try {
+    console.log(`   Compiling ${binaries.join(", ")}...`);
+    const { stdout, stderr } = await execAsync(
+      `cd src-tauri && cargo build ${binArgs}`,
+      { timeout: 300000 } // 5 minutes timeout
+    );
+
+    if (stderr && !stderr.includes("Finished")) {
+      console.log(`   ⚠️  build warnings: ${stderr.substring(0, 200)}...`);
     }
+
+    console.log(`   ✅ ${binaries.join(", ")} compiled successfully`);
+  } catch (error) {
+    console.error(`   ❌ Failed to compile CLI binaries:`, error.message);
+    throw error;
   }
 
   console.log("✅ All CLI binaries pre-compiled successfully!");
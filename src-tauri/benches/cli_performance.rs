@@ -1,8 +1,14 @@
+use claude_night_pilot_lib::interfaces::CLIAdapter;
+use claude_night_pilot_lib::unified_interface::UnifiedClaudeInterface;
 use criterion::{black_box, criterion_group, criterion_main, BenchmarkId, Criterion};
 use std::process::{Command, Stdio};
 use std::time::Instant;
 use tempfile::tempdir;
 
+// 直接啟動已編譯的 cnp-unified，避免每次迭代都經過 `cargo run` 的建置檢查與額外進程
+// 每次迭代仍會啟動新進程，因此啟動時間量測依舊是冷路徑
+const CNP_UNIFIED: &str = env!("CARGO_BIN_EXE_cnp-unified");
+
 // CLI 工具基準測試
 fn benchmark_cli_startup(c: &mut Criterion) {
     let mut group = c.benchmark_group("cli_startup");
@@ -11,16 +17,17 @@ fn benchmark_cli_startup(c: &mut Criterion) {
     group.bench_function("cnp_help", |b| {
         b.iter(|| {
             let start = Instant::now();
-            let output = Command::new("cargo")
-                .args(&["run", "--bin", "cnp-unified", "--", "--help"])
+            let status = Command::new(CNP_UNIFIED)
+                .args(&["--help"])
                 .current_dir(".")
-                .stdout(Stdio::piped())
-                .stderr(Stdio::piped())
-                .output()
+                .stdin(Stdio::null())
+                .stdout(Stdio::null())
+                .stderr(Stdio::null())
+                .status()
                 .expect("Failed to execute command");
 
             let duration = start.elapsed();
-            black_box((output, duration))
+            black_box((status, duration))
         });
     });
 
@@ -35,24 +42,17 @@ fn benchmark_cli_commands(c: &mut Criterion) {
     group.bench_function("health_check", |b| {
         b.iter(|| {
             let start = Instant::now();
-            let output = Command::new("cargo")
-                .args(&[
-                    "run",
-                    "--bin",
-                    "cnp-unified",
-                    "--",
-                    "health",
-                    "--format",
-                    "json",
-                ])
+            let status = Command::new(CNP_UNIFIED)
+                .args(&["health", "--format", "json"])
                 .current_dir(".")
-                .stdout(Stdio::piped())
-                .stderr(Stdio::piped())
-                .output()
+                .stdin(Stdio::null())
+                .stdout(Stdio::null())
+                .stderr(Stdio::null())
+                .status()
                 .expect("Health check failed");
 
             let duration = start.elapsed();
-            black_box((output, duration))
+            black_box((status, duration))
         });
     });
 
@@ -60,24 +60,43 @@ fn benchmark_cli_commands(c: &mut Criterion) {
     group.bench_function("cooldown_check", |b| {
         b.iter(|| {
             let start = Instant::now();
-            let output = Command::new("cargo")
-                .args(&[
-                    "run",
-                    "--bin",
-                    "cnp-unified",
-                    "--",
-                    "cooldown",
-                    "--format",
-                    "json",
-                ])
+            let status = Command::new(CNP_UNIFIED)
+                .args(&["cooldown", "--format", "json"])
                 .current_dir(".")
-                .stdout(Stdio::piped())
-                .stderr(Stdio::piped())
-                .output()
+                .stdin(Stdio::null())
+                .stdout(Stdio::null())
+                .stderr(Stdio::null())
+                .status()
                 .expect("Cooldown check failed");
 
             let duration = start.elapsed();
-            black_box((output, duration))
+            black_box((status, duration))
+        });
+    });
+
+    group.finish();
+}
+
+// 基準測試：同進程直接呼叫 cnp-unified 使用的函式庫路徑，與上方子進程版本對照
+// CLIAdapter 只在計時區外建立一次；CLI 每次執行都經 CLIAdapter::global() 建立兩次
+// （含服務與資料庫初始化）。因此兩組差距包含進程啟動、tokio runtime 建立、
+// 適配器初始化與 stdout 輸出，而非單純的進程啟動成本。
+// 兩組計時區內都仍會呼叫 `claude doctor` 子進程。
+fn benchmark_in_process_commands(c: &mut Criterion) {
+    let mut group = c.benchmark_group("in_process_commands");
+    let rt = tokio::runtime::Runtime::new().unwrap();
+    let adapter = rt.block_on(CLIAdapter::new()).unwrap();
+
+    // 對應 `cnp-unified health --format json`
+    group.bench_function("health_check", |b| {
+        b.iter(|| black_box(rt.block_on(adapter.cli_health_check("json", false))));
+    });
+
+    // 對應 `cnp-unified cooldown --format json`
+    group.bench_function("cooldown_check", |b| {
+        b.iter(|| {
+            let cooldown_info = rt.block_on(UnifiedClaudeInterface::check_cooldown());
+            black_box(cooldown_info.map(|info| serde_json::to_string_pretty(&info)))
         });
     });
 
@@ -130,24 +149,17 @@ fn benchmark_cli_under_load(c: &mut Criterion) {
                     for _ in 0..concurrent_processes {
                         let handle = std::thread::spawn(|| {
                             let start = Instant::now();
-                            let output = Command::new("cargo")
-                                .args(&[
-                                    "run",
-                                    "--bin",
-                                    "cnp-unified",
-                                    "--",
-                                    "health",
-                                    "--format",
-                                    "json",
-                                ])
+                            let status = Command::new(CNP_UNIFIED)
+                                .args(&["health", "--format", "json"])
                                 .current_dir(".")
-                                .stdout(Stdio::piped())
-                                .stderr(Stdio::piped())
-                                .output()
+                                .stdin(Stdio::null())
+                                .stdout(Stdio::null())
+                                .stderr(Stdio::null())
+                                .status()
                                 .expect("Health check failed");
 
                             let duration = start.elapsed();
-                            (output, duration)
+                            (status, duration)
                         });
                         handles.push(handle);
                     }
@@ -180,12 +192,8 @@ fn benchmark_cli_input_sizes(c: &mut Criterion) {
             |b, _| {
                 b.iter(|| {
                     let start = Instant::now();
-                    let output = Command::new("cargo")
+                    let status = Command::new(CNP_UNIFIED)
                         .args(&[
-                            "run",
-                            "--bin",
-                            "cnp-unified",
-                            "--",
                             "execute",
                             "--file",
                             input_file.to_str().unwrap(),
@@ -195,13 +203,14 @@ fn benchmark_cli_input_sizes(c: &mut Criterion) {
                             "json",
                         ])
                         .current_dir(".")
-                        .stdout(Stdio::piped())
-                        .stderr(Stdio::piped())
-                        .output()
+                        .stdin(Stdio::null())
+                        .stdout(Stdio::null())
+                        .stderr(Stdio::null())
+                        .status()
                         .expect("Execute failed");
 
                     let duration = start.elapsed();
-                    black_box((output, duration))
+                    black_box((status, duration))
                 });
             },
         );
@@ -217,11 +226,11 @@ fn benchmark_memory_usage(c: &mut Criterion) {
     group.bench_function("cli_memory_baseline", |b| {
         b.iter(|| {
             // 啟動進程並測量記憶體使用
-            let mut child = Command::new("cargo")
-                .args(&["run", "--bin", "cnp-unified", "--", "health"])
+            let mut child = Command::new(CNP_UNIFIED)
+                .args(&["health"])
                 .current_dir(".")
-                .stdout(Stdio::piped())
-                .stderr(Stdio::piped())
+                .stdout(Stdio::null())
+                .stderr(Stdio::null())
                 .spawn()
                 .expect("Failed to spawn process");
 
@@ -229,9 +238,9 @@ fn benchmark_memory_usage(c: &mut Criterion) {
             let pid = child.id();
 
             // 等待進程完成
-            let output = child.wait_with_output().expect("Process failed");
+            let status = child.wait().expect("Process failed");
 
-            black_box((pid, output))
+            black_box((pid, status))
         });
     });
 
@@ -242,6 +251,7 @@ criterion_group!(
     cli_benches,
     benchmark_cli_startup,
     benchmark_cli_commands,
+    benchmark_in_process_commands,
     benchmark_build_performance,
     benchmark_cli_under_load,
     benchmark_cli_input_sizes,
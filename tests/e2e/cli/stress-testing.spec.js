@@ -2,13 +2,24 @@
 // 測試 CLI 工具和 Tauri 命令在高負載和並發情況下的表現
 
 import { test, expect } from "@playwright/test";
-import { exec, spawn } from "child_process";
+import { execFile } from "child_process";
+import path from "path";
+import { fileURLToPath } from "url";
 import { promisify } from "util";
+import { summarizeDurations } from "../../utils/performance-helpers.js";
 
-const execAsync = promisify(exec);
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+const SRC_TAURI = path.resolve(__dirname, "../../../src-tauri");
+
+const execFileAsync = promisify(execFile);
 
 test.describe("CLI 壓力測試和 Tauri 命令並發測試", () => {
-  const CLI_BINARY = "cd src-tauri && cargo run --bin cnp-unified --";
+  // 以 argv 直接啟動 cargo，不經過 /bin/sh 解析命令字串
+  const CLI_ARGS = ["run", "--bin", "cnp-unified", "--"];
+  const CLI_OPTIONS = { cwd: SRC_TAURI };
+  const runCli = (...args) =>
+    execFileAsync("cargo", [...CLI_ARGS, ...args], CLI_OPTIONS);
 
   test.beforeEach(async ({ page }) => {
     await page.goto("http://localhost:8080", {
@@ -20,30 +31,30 @@ test.describe("CLI 壓力測試和 Tauri 命令並發測試", () => {
   test.describe("CLI 壓力測試", () => {
     test("大量並發 CLI 命令執行", async () => {
       const concurrencyLevel = 10;
-      const startTime = Date.now();
+      const startTime = performance.now();
       
       const promises = [];
       for (let i = 0; i < concurrencyLevel; i++) {
         promises.push(
-          execAsync(`${CLI_BINARY} status`)
+          runCli("status")
             .then(result => ({
               success: true,
               index: i,
               stdout: result.stdout.trim(),
               stderr: result.stderr.trim(),
-              duration: Date.now() - startTime
+              duration: performance.now() - startTime
             }))
             .catch(error => ({
               success: false,
               index: i,
               error: error.message,
-              duration: Date.now() - startTime
+              duration: performance.now() - startTime
             }))
         );
       }
 
       const results = await Promise.all(promises);
-      const endTime = Date.now();
+      const endTime = performance.now();
       const totalDuration = endTime - startTime;
 
       const successful = results.filter(r => r.success).length;
@@ -53,7 +64,7 @@ test.describe("CLI 壓力測試和 Tauri 命令並發測試", () => {
       expect(successful).toBeGreaterThan(concurrencyLevel * 0.7); // 至少70%成功
       expect(totalDuration).toBeLessThan(30000); // 30秒內完成
 
-      console.log(`✅ CLI 並發測試: ${successful}/${concurrencyLevel} 成功 (${(successRate * 100).toFixed(1)}%), 耗時: ${totalDuration}ms`);
+      console.log(`✅ CLI 並發測試: ${successful}/${concurrencyLevel} 成功 (${(successRate * 100).toFixed(1)}%), 耗時: ${totalDuration.toFixed(2)}ms`);
       
       // 檢查每個成功的結果都包含期望內容
       const validResults = results.filter(r => r.success && r.stdout.length > 0).length;
@@ -68,51 +79,51 @@ test.describe("CLI 壓力測試和 Tauri 命令並發測試", () => {
         "status"
       ];
 
-      const startTime = Date.now();
+      const startTime = performance.now();
       const results = [];
 
       for (const command of commandSequence) {
         try {
-          const result = await execAsync(`${CLI_BINARY} ${command}`);
+          const result = await runCli(command);
           results.push({
             success: true,
             command: command,
             stdout: result.stdout.trim(),
-            duration: Date.now() - startTime
+            duration: performance.now() - startTime
           });
         } catch (error) {
           results.push({
             success: false,
             command: command,
             error: error.message,
-            duration: Date.now() - startTime
+            duration: performance.now() - startTime
           });
         }
       }
 
-      const endTime = Date.now();
+      const endTime = performance.now();
       const totalDuration = endTime - startTime;
 
       const successful = results.filter(r => r.success).length;
       expect(successful).toBe(commandSequence.length); // 所有命令都應該成功
       expect(totalDuration).toBeLessThan(15000); // 15秒內完成
 
-      console.log(`✅ CLI 連續執行測試: ${successful}/${commandSequence.length} 成功, 耗時: ${totalDuration}ms`);
+      console.log(`✅ CLI 連續執行測試: ${successful}/${commandSequence.length} 成功, 耗時: ${totalDuration.toFixed(2)}ms`);
     });
 
     test("CLI 長時間運行壓力測試", async () => {
       const testDuration = 10000; // 10秒測試
       const interval = 500; // 每500ms一個命令
       
-      const startTime = Date.now();
+      const startTime = performance.now();
       const results = [];
       let operationCount = 0;
 
-      while (Date.now() - startTime < testDuration) {
+      while (performance.now() - startTime < testDuration) {
         try {
-          const commandStartTime = Date.now();
-          const result = await execAsync(`${CLI_BINARY} status`);
-          const commandDuration = Date.now() - commandStartTime;
+          const commandStartTime = performance.now();
+          const result = await runCli("status");
+          const commandDuration = performance.now() - commandStartTime;
           
           results.push({
             success: true,
@@ -134,19 +145,19 @@ test.describe("CLI 壓力測試和 Tauri 命令並發測試", () => {
         }
       }
 
-      const endTime = Date.now();
+      const endTime = performance.now();
       const totalDuration = endTime - startTime;
       const successful = results.filter(r => r.success).length;
       const successRate = successful / results.length;
-      const avgDuration = results
-        .filter(r => r.success && r.duration)
-        .reduce((sum, r) => sum + r.duration, 0) / successful;
+      const { avg: avgDuration } = summarizeDurations(
+        results.filter(r => r.success && r.duration).map(r => r.duration)
+      );
 
       expect(successRate).toBeGreaterThan(0.8); // 80% 成功率
       expect(avgDuration).toBeLessThan(5000); // 平均每個命令5秒內完成
 
       console.log(`✅ CLI 長時間壓力測試: ${successful}/${operationCount} 成功 (${(successRate * 100).toFixed(1)}%)`);
-      console.log(`   總耗時: ${totalDuration}ms, 平均命令耗時: ${avgDuration.toFixed(2)}ms`);
+      console.log(`   總耗時: ${totalDuration.toFixed(2)}ms, 平均命令耗時: ${avgDuration.toFixed(2)}ms`);
     });
   });
 
@@ -449,12 +460,21 @@ test.describe("CLI 壓力測試和 Tauri 命令並發測試", () => {
       for (const command of commands) {
         const measurements = [];
         const iterations = 5;
+        const warmup = 1;
+        // argv 與選項只建立一次；輸出不會被檢查，以 Buffer 接收省去 UTF-8 解碼
+        const argv = [...CLI_ARGS, command];
+        const options = { ...CLI_OPTIONS, encoding: "buffer" };
+
+        // 預熱執行不計入樣本（與 hyperfine -w 相同），避免首次編譯與冷快取扭曲統計
+        for (let i = 0; i < warmup; i++) {
+          await execFileAsync("cargo", argv, options).catch(() => {});
+        }
 
         for (let i = 0; i < iterations; i++) {
-          const startTime = Date.now();
+          const startTime = performance.now();
           try {
-            await execAsync(`${CLI_BINARY} ${command}`);
-            const endTime = Date.now();
+            await execFileAsync("cargo", argv, options);
+            const endTime = performance.now();
             measurements.push(endTime - startTime);
           } catch (error) {
             measurements.push(-1); // 標記失敗
@@ -462,15 +482,21 @@ test.describe("CLI 壓力測試和 Tauri 命令並發測試", () => {
         }
 
         const successful = measurements.filter(m => m > 0);
-        const avgTime = successful.reduce((sum, time) => sum + time, 0) / successful.length;
-        const minTime = Math.min(...successful);
-        const maxTime = Math.max(...successful);
+        const {
+          avg: avgTime,
+          min: minTime,
+          max: maxTime,
+          median: medianTime,
+        } = summarizeDurations(successful);
 
         expect(successful.length).toBeGreaterThan(iterations * 0.8); // 80% 成功率
-        expect(avgTime).toBeLessThan(10000); // 平均10秒內響應（包含編譯時間）
+        // 編譯已由預熱執行吸收，但門檻維持寬鬆：cooldown/health 會呼叫無逾時的
+        // `claude doctor`，冷卻檢查失敗時另有 0.5s/1.0s 重試退避，
+        // 且 CI 平行執行時樣本仍可能等待 Cargo 建置鎖
+        expect(avgTime).toBeLessThan(10000); // 平均10秒內響應
         expect(maxTime).toBeLessThan(20000); // 最大20秒內響應
 
-        console.log(`✅ CLI ${command}: 平均 ${avgTime.toFixed(2)}ms (${minTime.toFixed(2)}-${maxTime.toFixed(2)}ms), 成功率 ${successful.length}/${iterations}`);
+        console.log(`✅ CLI ${command}: 中位數 ${medianTime.toFixed(2)}ms, 最佳 ${minTime.toFixed(2)}ms, 平均 ${avgTime.toFixed(2)}ms, 最差 ${maxTime.toFixed(2)}ms, 成功率 ${successful.length}/${iterations}`);
       }
     });
 
@@ -9,10 +9,8 @@ import { fileURLToPath } from "url";
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-const CLI_BINARY = path.join(
-  __dirname,
-  "../../src-tauri/target/debug/cnp-unified"
-);
+const SRC_TAURI = path.resolve(__dirname, "../../../src-tauri");
+const CLI_BINARY = path.join(SRC_TAURI, "target/debug/cnp-unified");
 
 test.describe("GUI與CLI功能一致性測試", () => {
   let page;
@@ -303,6 +301,7 @@ async function executeCLI(args) {
     });
 
     child.on("close", (exitCode) => {
+      clearTimeout(timer);
       resolve({
         exitCode,
         stdout: stdout.trim(),
@@ -310,8 +309,8 @@ async function executeCLI(args) {
       });
     });
 
-    // 設置超時
-    setTimeout(() => {
+    // 設置超時（進程結束時清除，避免計時器滯留）
+    const timer = setTimeout(() => {
       child.kill();
       resolve({
         exitCode: -1,
@@ -9,15 +9,10 @@ import { fileURLToPath } from "url";
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-// 測試配置
-const TAURI_BINARY = path.join(
-  __dirname,
-  "../../src-tauri/target/debug/claude-night-pilot"
-);
-const CLI_BINARY = path.join(
-  __dirname,
-  "../../src-tauri/target/debug/cnp-unified"
-);
+// 測試配置（由本檔位置推導，不依賴執行時的工作目錄）
+const SRC_TAURI = path.resolve(__dirname, "../../../src-tauri");
+const TAURI_BINARY = path.join(SRC_TAURI, "target/debug/claude-night-pilot");
+const CLI_BINARY = path.join(SRC_TAURI, "target/debug/cnp-unified");
 
 test.describe("統一介面端到端測試", () => {
   let tauriApp;
@@ -106,10 +101,8 @@ test.describe("統一介面端到端測試", () => {
 
       console.log("✅ CLI批量執行配置測試通過");
     } finally {
-      // 清理測試文件
-      if (fs.existsSync(testBatchFile)) {
-        fs.unlinkSync(testBatchFile);
-      }
+      // 清理測試文件（force 讓不存在時直接略過，省去額外的 stat）
+      fs.rmSync(testBatchFile, { force: true });
     }
   });
 
@@ -210,6 +203,7 @@ async function executeCLI(args) {
     });
 
     child.on("close", (exitCode) => {
+      clearTimeout(timer);
       resolve({
         exitCode,
         stdout: stdout.trim(),
@@ -217,8 +211,8 @@ async function executeCLI(args) {
       });
     });
 
-    // 設置超時
-    setTimeout(() => {
+    // 設置超時（進程結束時清除，避免計時器滯留）
+    const timer = setTimeout(() => {
       child.kill();
       resolve({
         exitCode: -1,
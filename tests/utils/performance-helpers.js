@@ -76,6 +76,44 @@ export class PerformanceProfiler {
   }
 }
 
+/**
+ * Summarize a list of durations (ms): avg/min/max in a single pass, plus median.
+ * An empty list yields count 0 and 0 for every statistic; check `count` before
+ * treating the values as measurements.
+ */
+export function summarizeDurations(durations) {
+  const count = durations.length;
+  if (count === 0) {
+    return { count, avg: 0, min: 0, max: 0, median: 0 };
+  }
+
+  let sum = 0;
+  let min = Infinity;
+  let max = -Infinity;
+
+  for (const duration of durations) {
+    sum += duration;
+    if (duration < min) {
+      min = duration;
+    }
+    if (duration > max) {
+      max = duration;
+    }
+  }
+
+  const sorted = [...durations].sort((a, b) => a - b);
+  const mid = Math.floor(count / 2);
+  const median = count % 2 === 1 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+
+  return {
+    count,
+    avg: sum / count,
+    min,
+    max,
+    median,
+  };
+}
+
 /**
  * Concurrent operation utilities
  */
@@ -283,17 +321,17 @@ export class DatabasePerformanceTester {
     profiler.end();
 
     const successfulResults = results.filter(r => r.success);
-    const avgDuration = successfulResults.length > 0 
-      ? successfulResults.reduce((sum, r) => sum + r.duration, 0) / successfulResults.length
-      : 0;
+    const stats = summarizeDurations(successfulResults.map(r => r.duration));
+    const avgDuration = stats.avg;
 
     const report = {
       queryName,
       iterations,
       successfulIterations: successfulResults.length,
       avgDuration,
-      minDuration: Math.min(...successfulResults.map(r => r.duration)),
-      maxDuration: Math.max(...successfulResults.map(r => r.duration)),
+      minDuration: stats.min,
+      maxDuration: stats.max,
+      medianDuration: stats.median,
       results,
       performance: profiler.getReport(),
     };
@@ -303,6 +341,7 @@ export class DatabasePerformanceTester {
     console.log(`   Average duration: ${avgDuration.toFixed(2)}ms`);
     console.log(`   Min duration: ${report.minDuration.toFixed(2)}ms`);
     console.log(`   Max duration: ${report.maxDuration.toFixed(2)}ms`);
+    console.log(`   Median duration: ${report.medianDuration.toFixed(2)}ms`);
 
     return report;
   }